@@ -0,0 +1,112 @@
+"""
+On-disk cache for LLM chat completion responses.
+"""
+
+# Importing necessary libraries and modules
+import os
+import json
+import time
+import logging
+import hashlib
+import tempfile
+import contextlib
+from pathlib import Path
+
+from typing import Any, Dict, Optional
+
+# Set up logging
+_logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    A content-addressed cache for chat completion responses.
+
+    Each response is stored as a JSON file named after a BLAKE2b hash of the
+    request payload (model, messages, response format and sampling parameters),
+    so re-running the pipeline on an unchanged dataset is served from disk
+    instead of the API.
+
+    Attributes:
+        cache_dir (Path): Directory where responses are stored.
+        ttl (Optional[float]): Time-to-live of an entry in seconds. None never expires.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/llm", ttl: Optional[float] = None) -> None:
+        """
+        Initialize the ResponseCache.
+
+        Args:
+            cache_dir (str): Directory where responses are stored. Defaults to ".cache/llm".
+            ttl (Optional[float]): Time-to-live of an entry in seconds. Defaults to None.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """
+        Build the cache key for a request payload.
+
+        Args:
+            payload (Dict[str, Any]): The request parameters sent to the API.
+
+        Returns:
+            str: Hex digest identifying the request.
+        """
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=32).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached response for a key, or None on a miss or expired entry.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[Dict[str, Any]]: The cached response.
+        """
+        path = self._path(key)
+        try:
+            if self.ttl is not None and time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            with path.open("r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            _logger.warning("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+    def set(self, key: str, response: Dict[str, Any]) -> None:
+        """
+        Store a response under a key.
+
+        The entry is written to a uniquely named temporary file first and then moved
+        into place, so concurrent readers never see a partially written file and
+        concurrent writers of the same key do not share a temporary file. The cache
+        directory is created on the first write.
+
+        Args:
+            key (str): The cache key.
+            response (Dict[str, Any]): The response to store.
+        """
+        path = self._path(key)
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                json.dump(response, f, default=str)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            _logger.warning("Failed to write cache entry %s: %s", path, e)
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
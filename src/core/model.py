@@ -2,30 +2,52 @@
 
 """
 
-# Adding directories to system path to allow importing custom modules
-import sys
-
-sys.path.append("./")
-sys.path.append("../")
-
 # Importing necessary libraries and modules
 import os
+import json
+import time
+import asyncio
 import logging
-from openai import OpenAI
-from dotenv import load_dotenv
+import functools
+from openai import OpenAI, AsyncOpenAI
+
+from src.core.cache import ResponseCache
 
 from typing import Any, Dict, List, Optional
 
 # Set up logging
 _logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s - line: %(lineno)d",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 
-# Load Environment variables
-load_dotenv(override=True)
+
+@functools.lru_cache(maxsize=8)
+def _get_client(api_key: Optional[str]) -> OpenAI:
+    """
+    Return a shared OpenAI client for an API key.
+
+    Every handler with the same key reuses one client, and with it one HTTP
+    connection pool and its TLS sessions. The client is thread-safe. The
+    handler itself is not shared because it carries conversation history.
+    """
+    return OpenAI(api_key=api_key)
+
+
+def _async_http_client() -> Optional[Any]:
+    """
+    Return an aiohttp-backed HTTP client for AsyncOpenAI, if available.
+
+    The SDK's default httpx client degrades badly once more than ~20 requests
+    are in flight; aiohttp keeps latency flat at the concurrency used by
+    ``chat_completion_many``. Requires ``pip install openai[aiohttp]``; returns
+    None (the SDK default) otherwise.
+    """
+    try:
+        from openai import DefaultAioHttpClient
+
+        return DefaultAioHttpClient()
+    except (ImportError, RuntimeError):
+        # RuntimeError is raised when the aiohttp extra is not installed
+        return None
+
 
 class OpenAIChatHandler:
     """
@@ -36,20 +58,30 @@ class OpenAIChatHandler:
         model (str): The OpenAI model to use for chat.
         openai (OpenAI): An instance of the OpenAI client.
         chat_history (List[Dict[str, Any]]): A list to store the history of chats.
+        cache (Optional[ResponseCache]): On-disk cache of responses, None when disabled.
     """
 
-    def __init__(self, openai_key: str, model: str = "gpt-4o") -> None:
+    def __init__(
+        self,
+        openai_key: str,
+        model: str = "gpt-4o",
+        cache_dir: Optional[str] = ".cache/llm",
+        cache_ttl: Optional[float] = None,
+    ) -> None:
         """
         Initialize the OpenAIChatHandler class.
 
         Args:
         - openai_key (str): The OpenAI API key to use for authentication.
         - model (str): The name of the OpenAI model to use for chat. Defaults to "gpt-4o".
+        - cache_dir (Optional[str]): Directory for cached responses. None disables caching.
+        - cache_ttl (Optional[float]): Lifetime of a cached response in seconds. Defaults to None (no expiry).
         """
         self.openai_key = openai_key or os.getenv("OPENAI_API_KEY")
         self.model = model
-        self.openai = OpenAI(api_key=self.openai_key)
+        self.openai = _get_client(self.openai_key)
         self.conversation_history: List[Dict[str, Any]] = []
+        self.cache = ResponseCache(cache_dir, ttl=cache_ttl) if cache_dir else None
 
     def _validate_response_format(self, response_format: str) -> str:
         """
@@ -85,6 +117,7 @@ class OpenAIChatHandler:
         streaming: bool = False,
         is_structured_output: bool = False,
         json_schema: Optional[Dict[str, Any]] = None,
+        force_refresh: bool = False,
     ) -> Dict[str, Any]:
         """
         Generate a chat completion with support for multi-turn conversations.
@@ -103,6 +136,16 @@ class OpenAIChatHandler:
             streaming (bool): Whether to use streaming responses. Defaults to False.
             is_structured_output (bool): Whether the output should be structured. Defaults to False.
             json_schema (Optional[Dict[str, Any]]): Schema for structured JSON output.
+            force_refresh (bool): Bypass the response cache and call the API. Defaults to False.
+
+        Non-streaming responses are cached on disk, keyed on the model, the full message
+        list, the response format and the sampling parameters; an identical request is
+        answered from the cache without calling the API.
+
+        The system prompt is always sent as the first message, so callers that keep
+        it static (and put per-request data in ``prompt``) get a stable prefix that
+        OpenAI's automatic prompt caching can reuse. The number of cached prompt
+        tokens is reported under the ``cached_tokens`` key of the response.
 
         Returns:
             Dict[str, Any]: The response from the API.
@@ -113,23 +156,89 @@ class OpenAIChatHandler:
         # Constants for roles
         ROLE_SYSTEM = "system"
         ROLE_USER = "user"
-        ROLE_ASSISTANT = "assistant"
 
         # Validate arguments
         if not prompt:
             raise ValueError("Prompt cannot be empty.")
-        if is_structured_output and not json_schema:
-            raise ValueError("JSON schema must be provided for structured output.")
 
-        # Initialize or extend the conversation history
+        # Initialize or extend the conversation history; it is only stored once the
+        # request has been validated, so a rejected call leaves the history unchanged
         if messages:
-            self.conversation_history = messages
+            history = messages
         else:
-            if system_prompt and not self.conversation_history:
-                self.conversation_history.append(
-                    {"role": ROLE_SYSTEM, "content": system_prompt}
-                )
-            self.conversation_history.append({"role": ROLE_USER, "content": prompt})
+            history = list(self.conversation_history)
+            if system_prompt and not history:
+                history.append({"role": ROLE_SYSTEM, "content": system_prompt})
+            history.append({"role": ROLE_USER, "content": prompt})
+
+        request = self._build_request(
+            messages=history,
+            response_format=response_format,
+            is_structured_output=is_structured_output,
+            json_schema=json_schema,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            frequency_penalty=frequency_penalty,
+            presence_penalty=presence_penalty,
+            tools=tools,
+        )
+        self.conversation_history = history
+
+        # Serve identical requests from the cache
+        cache_key = None
+        if self.cache is not None and not streaming:
+            cache_key = ResponseCache.make_key(request)
+            if not force_refresh:
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    _logger.info("Chat completion served from cache.")
+                    self._append_assistant_message(cached)
+                    return cached
+
+        # Call the API
+        try:
+            response = self.openai.chat.completions.create(**request, stream=streaming)
+            response = response.to_dict()
+
+            # Record prompt token usage and cache hits
+            self._record_usage(response)
+
+            # Add the assistant's response to the conversation history
+            self._append_assistant_message(response)
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate chat completion: {e}")
+
+        if cache_key is not None:
+            self.cache.set(cache_key, response)
+        return response
+
+    def _build_request(
+        self,
+        messages: List[Dict[str, Any]],
+        response_format: str = "text",
+        is_structured_output: bool = False,
+        json_schema: Optional[Dict[str, Any]] = None,
+        **params: Any,
+    ) -> Dict[str, Any]:
+        """
+        Build the keyword arguments for a chat completion request.
+
+        Args:
+        - messages (List[Dict[str, Any]]): The messages to send.
+        - response_format (str): The response format. Defaults to "text".
+        - is_structured_output (bool): Whether the output should be structured. Defaults to False.
+        - json_schema (Optional[Dict[str, Any]]): Schema for structured JSON output.
+        - params: Sampling parameters (temperature, max_tokens, ...) passed as-is.
+
+        Returns:
+        - Dict[str, Any]: The request keyword arguments.
+
+        Raises:
+        - ValueError: If the response format and structured output settings disagree.
+        """
+        if is_structured_output and not json_schema:
+            raise ValueError("JSON schema must be provided for structured output.")
 
         # Response format configuration
         if not is_structured_output and response_format != "text":
@@ -140,31 +249,241 @@ class OpenAIChatHandler:
         if is_structured_output:
             response_config["json_schema"] = json_schema
 
-        # Call the API
+        return {
+            "model": self.model,
+            "messages": messages,
+            "response_format": response_config,
+            **params,
+        }
+
+    def _record_usage(self, response: Dict[str, Any]) -> None:
+        """
+        Surface prompt-cache hits in the response (OpenAI caches static prefixes
+        automatically) and log the prompt token usage.
+
+        Args:
+        - response (Dict[str, Any]): The chat completion response.
+        """
+        usage = response.get("usage") or {}
+        response["cached_tokens"] = (
+            usage.get("prompt_tokens_details") or {}
+        ).get("cached_tokens", 0)
+        _logger.info(
+            "Prompt tokens: %s (cached: %s)",
+            usage.get("prompt_tokens"),
+            response["cached_tokens"],
+        )
+
+    def chat_completion_many(self, prompts: List[str], **kwargs: Any) -> List[Dict[str, Any]]:
+        """
+        Generate independent single-turn chat completions for several prompts concurrently.
+
+        Synchronous wrapper around ``achat_completion_many``, which it runs in a new
+        event loop. It therefore cannot be called while an event loop is running
+        (e.g. in Jupyter or an async web handler); await ``achat_completion_many``
+        there instead.
+
+        Args:
+            prompts (List[str]): The user prompts.
+            kwargs: Keyword arguments of ``achat_completion_many``.
+
+        Returns:
+            List[Dict[str, Any]]: The responses, in the same order as ``prompts``.
+
+        Raises:
+            ValueError: If a prompt is empty or invalid arguments are provided.
+            RuntimeError: If called from a running event loop.
+        """
         try:
-            response = self.openai.chat.completions.create(
-                model=self.model,
-                messages=self.conversation_history,
-                response_format=response_config,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                top_p=top_p,
-                frequency_penalty=frequency_penalty,
-                presence_penalty=presence_penalty,
-                tools=tools,
-                stream=streaming,
-            )
-            response = response.to_dict()
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.achat_completion_many(prompts, **kwargs))
+        raise RuntimeError(
+            "chat_completion_many() cannot be called from a running event loop; "
+            "await achat_completion_many() instead."
+        )
 
-            # Add the assistant's response to the conversation history
-            self.conversation_history.append(
-                {
-                    "role": ROLE_ASSISTANT,
-                    "content": response.get("choices", [{}])[0]
-                    .get("message", {})
-                    .get("content", ""),
-                }
+    async def achat_completion_many(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        response_format: str = "text",
+        is_structured_output: bool = False,
+        json_schema: Optional[Dict[str, Any]] = None,
+        concurrency: int = 32,
+        force_refresh: bool = False,
+        **params: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate independent single-turn chat completions for several prompts concurrently.
+
+        The requests are issued with the async client and at most ``concurrency``
+        are in flight at once, so N prompts cost roughly one round-trip instead
+        of N. Each prompt is sent on its own (system prompt + user prompt); the
+        conversation history is neither used nor updated. Cached responses are
+        reused exactly as in ``chat_completion``.
+
+        Args:
+            prompts (List[str]): The user prompts.
+            system_prompt (Optional[str]): System prompt shared by all requests.
+            response_format (str): The response format. Defaults to "text".
+            is_structured_output (bool): Whether the output should be structured. Defaults to False.
+            json_schema (Optional[Dict[str, Any]]): Schema for structured JSON output.
+            concurrency (int): Maximum number of requests in flight. Defaults to 32.
+            force_refresh (bool): Bypass the response cache and call the API. Defaults to False.
+            params: Sampling parameters (temperature, max_tokens, ...) for every request.
+
+        Returns:
+            List[Dict[str, Any]]: The responses, in the same order as ``prompts``.
+
+        Raises:
+            ValueError: If a prompt is empty or invalid arguments are provided.
+        """
+        if not all(prompts):
+            raise ValueError("Prompt cannot be empty.")
+
+        params = {
+            "temperature": 0.7,
+            "max_tokens": 600,
+            "top_p": 1.0,
+            "frequency_penalty": 0.0,
+            "presence_penalty": 0.0,
+            "tools": None,
+            **params,
+        }
+        requests = []
+        for prompt in prompts:
+            messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
+            messages.append({"role": "user", "content": prompt})
+            requests.append(
+                self._build_request(
+                    messages=messages,
+                    response_format=response_format,
+                    is_structured_output=is_structured_output,
+                    json_schema=json_schema,
+                    **params,
+                )
             )
-            return response
-        except Exception as e:
-            raise RuntimeError(f"Failed to generate chat completion: {e}")
+
+        # Split into cache hits and requests that need the API
+        responses: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        keys = [
+            ResponseCache.make_key(request) if self.cache is not None else None
+            for request in requests
+        ]
+        if self.cache is not None and not force_refresh:
+            for i, key in enumerate(keys):
+                responses[i] = self.cache.get(key)
+        pending = [i for i, response in enumerate(responses) if response is None]
+        _logger.info(
+            "Chat completions: %d cached, %d to request.",
+            len(requests) - len(pending),
+            len(pending),
+        )
+
+        if pending:
+            try:
+                fetched = await self._gather_completions(
+                    [requests[i] for i in pending], concurrency
+                )
+            except Exception as e:
+                raise RuntimeError(f"Failed to generate chat completions: {e}")
+            for i, response in zip(pending, fetched):
+                self._record_usage(response)
+                responses[i] = response
+                if self.cache is not None:
+                    self.cache.set(keys[i], response)
+
+        return responses
+
+    async def _gather_completions(
+        self, requests: List[Dict[str, Any]], concurrency: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Run chat completion requests concurrently with the async client.
+
+        Args:
+        - requests (List[Dict[str, Any]]): Request keyword arguments.
+        - concurrency (int): Maximum number of requests in flight.
+
+        Returns:
+        - List[Dict[str, Any]]: The responses, in request order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        async with AsyncOpenAI(
+            api_key=self.openai_key, http_client=_async_http_client()
+        ) as client:
+
+            async def _complete(request: Dict[str, Any]) -> Dict[str, Any]:
+                async with semaphore:
+                    response = await client.chat.completions.create(**request)
+                    return response.to_dict()
+
+            return await asyncio.gather(*(_complete(request) for request in requests))
+
+    def submit_batch(
+        self, jsonl_path: str, poll_interval: float = 30.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Run a file of chat completion requests through the OpenAI Batch API.
+
+        The Batch API is billed at a discount and suits large offline runs where
+        results are not needed immediately. Each line of ``jsonl_path`` must be a
+        request object of the form
+        ``{"custom_id": ..., "method": "POST", "url": "/v1/chat/completions", "body": {...}}``.
+        This call blocks, polling every ``poll_interval`` seconds, until the batch finishes.
+
+        Args:
+            jsonl_path (str): Path to the JSONL file of requests.
+            poll_interval (float): Seconds between status checks. Defaults to 30.
+
+        Returns:
+            List[Dict[str, Any]]: The result lines (``custom_id``, ``response``, ``error``),
+                in the order the requests appear in the input file.
+
+        Raises:
+            RuntimeError: If the batch does not complete successfully.
+        """
+        with open(jsonl_path, "rb") as f:
+            input_file = self.openai.files.create(file=f, purpose="batch")
+        batch = self.openai.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        _logger.info("Submitted batch %s from %s", batch.id, jsonl_path)
+
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(poll_interval)
+            batch = self.openai.batches.retrieve(batch.id)
+            _logger.info("Batch %s status: %s", batch.id, batch.status)
+
+        if batch.status != "completed" or not batch.output_file_id:
+            raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'")
+
+        results = {}
+        for line in self.openai.files.content(batch.output_file_id).text.splitlines():
+            if line.strip():
+                result = json.loads(line)
+                results[result["custom_id"]] = result
+
+        # Output lines are not guaranteed to be in input order
+        with open(jsonl_path, "r", encoding="utf-8") as f:
+            order = [json.loads(line)["custom_id"] for line in f if line.strip()]
+        return [results[custom_id] for custom_id in order if custom_id in results]
+
+    def _append_assistant_message(self, response: Dict[str, Any]) -> None:
+        """
+        Add the assistant's reply from a response to the conversation history.
+
+        Args:
+        - response (Dict[str, Any]): The chat completion response.
+        """
+        self.conversation_history.append(
+            {
+                "role": "assistant",
+                "content": response.get("choices", [{}])[0]
+                .get("message", {})
+                .get("content", ""),
+            }
+        )
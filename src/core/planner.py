@@ -3,31 +3,49 @@
 
 """
 
-# Adding directories to system path to allow importing custom modules
-import sys
-
-sys.path.append("./")
-sys.path.append("../")
-
 # Importing necessary libraries and modules
 import os
 import logging
-from dotenv import load_dotenv
 
 from src.core.model import OpenAIChatHandler
 
-from typing import Dict, Any
+from typing import Dict, Any, Final, List, Tuple
 
 # Set up logging
 _logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s - line: %(lineno)d",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 
-# Load Environment variables
-load_dotenv(override=True)
+_PLANNER_SYSTEM_PROMPT: Final[str] = """
+You are provided with a dataset that includes various structured data fields. 
+Your task is to create a detailed and actionable plan based on this data. 
+The user message contains the inferred schema (under "Schema Inference") and the
+dataset metadata (under "Data Summary"). Follow the steps below:
+
+Schema Inference:
+Analyze the dataset to infer its underlying schema. Identify key fields, data types, and relationships among the fields.
+Note any missing, anomalous, or unexpected data points that might influence your plan.
+
+Data Summary:
+Summarize the main trends, patterns, and statistics derived from the dataset.
+Highlight critical insights that could drive decision-making.
+Chain-of-Thought (CoT) Reasoning:
+
+Break down your reasoning into clear, step-by-step thoughts.
+Document your thought process as you analyze the schema and data summary, including any assumptions and intermediate conclusions.
+ReACT Style – Reflect, Act, and Check:
+
+Reflect: Consider the insights from the schema inference and data summary. Ask yourself: What are the most pressing issues or opportunities revealed by the data?
+Act: Based on your reflection, propose specific, actionable steps and strategies that address these issues or opportunities.
+Check: Evaluate your proposed plan against the objectives and constraints outlined by the dataset’s context. 
+        Validate that your plan is feasible and aligned with the data insights.
+Final Plan:
+
+Synthesize your chain-of-thought and ReACT reasoning to produce a comprehensive plan.
+Ensure your final plan includes clear objectives, actionable items, timelines (if applicable), and any contingencies or recommendations.
+Output both your step-by-step reasoning (chain-of-thought) and the final detailed plan. Your response should clearly 
+document how the insights from the data informed each element of the plan.
+
+**IMPORTANT** : DO NOT CREATE NEW COLUMN NAMES OR CHANGE THE EXISTING COLUMN NAMES FOR THE EXECUTIONER PLANS.
+"""
 
 
 class Planner:
@@ -99,8 +117,31 @@ class Planner:
         self.openai = OpenAIChatHandler(self.openai_key)
         _logger.info("Planner initialized...")
 
+    def _build_prompt(self, schema_inference: str, metadata: Dict[str, Any]) -> str:
+        """
+        Build the user prompt from the inferred schema and the metadata.
+
+        Args:
+            schema_inference (str): The inferred schema information.
+            metadata (Dict[str, Any]): The metadata containing additional information.
+
+        Returns:
+            str: The user prompt.
+        """
+        return f"""
+        Schema Inference:
+        {schema_inference}
+
+        Data Summary:
+        {metadata}
+        """
+
     def generate_plan(
-        self, schema_inference: str, metadata: Dict[str, Any]
+        self,
+        schema_inference: str,
+        metadata: Dict[str, Any],
+        force_refresh: bool = False,
+        max_tokens: int = 1024,
     ) -> Dict[str, Any]:
         """
         Generates a plan for the given task using schema inference and metadata.
@@ -113,54 +154,90 @@ class Planner:
         Args:
             schema_inference (str): The inferred schema information.
             metadata (Dict[str, Any]): The metadata containing additional information.
+            force_refresh (bool): Regenerate the plan even if a cached response exists.
+            max_tokens (int): Output token budget. The plan JSON rarely needs more
+                than 1024 tokens; raise it for very wide datasets. Defaults to 1024.
 
         Returns:
             Dict[str, Any]: The generated plan as a JSON object.
         """
 
-        SYSTEM_PROMPT = f"""
-        You are provided with a dataset that includes various structured data fields. 
-        Your task is to create a detailed and actionable plan based on this data. 
-        Follow the steps below:
-
-        Schema Inference:
-        {schema_inference}
-
-        Analyze the dataset to infer its underlying schema. Identify key fields, data types, and relationships among the fields.
-        Note any missing, anomalous, or unexpected data points that might influence your plan.
-        Data Summary:
-        {metadata}
-
-        Summarize the main trends, patterns, and statistics derived from the dataset.
-        Highlight critical insights that could drive decision-making.
-        Chain-of-Thought (CoT) Reasoning:
-
-        Break down your reasoning into clear, step-by-step thoughts.
-        Document your thought process as you analyze the schema and data summary, including any assumptions and intermediate conclusions.
-        ReACT Style – Reflect, Act, and Check:
-
-        Reflect: Consider the insights from the schema inference and data summary. Ask yourself: What are the most pressing issues or opportunities revealed by the data?
-        Act: Based on your reflection, propose specific, actionable steps and strategies that address these issues or opportunities.
-        Check: Evaluate your proposed plan against the objectives and constraints outlined by the dataset’s context. 
-                Validate that your plan is feasible and aligned with the data insights.
-        Final Plan:
-
-        Synthesize your chain-of-thought and ReACT reasoning to produce a comprehensive plan.
-        Ensure your final plan includes clear objectives, actionable items, timelines (if applicable), and any contingencies or recommendations.
-        Output both your step-by-step reasoning (chain-of-thought) and the final detailed plan. Your response should clearly 
-        document how the insights from the data informed each element of the plan.
-        
-        **IMPORTANT** : DO NOT CREATE NEW COLUMN NAMES OR CHANGE THE EXISTING COLUMN NAMES FOR THE EXECUTIONER PLANS.
-        """
+        # Keep the system prompt static so the provider can cache it as a prefix;
+        # the per-dataset inputs go at the end, in the user message.
+        prompt = self._build_prompt(schema_inference, metadata)
 
         _logger.info("Generating plan...")
         # Call the OpenAI API to generate the plan
         response = self.openai.chat_completion(
-            prompt=schema_inference,
-            system_prompt=SYSTEM_PROMPT,
-            max_tokens=4096,
+            prompt=prompt,
+            system_prompt=_PLANNER_SYSTEM_PROMPT,
+            max_tokens=max_tokens,
             response_format="json_schema",
             is_structured_output=True,
             json_schema=self.response_format,
+            force_refresh=force_refresh,
         )
         return response
+
+    def generate_plan_many(
+        self,
+        pairs: List[Tuple[str, Dict[str, Any]]],
+        concurrency: int = 32,
+        force_refresh: bool = False,
+        max_tokens: int = 1024,
+    ) -> List[Dict[str, Any]]:
+        """
+        Generates plans for several datasets with concurrent requests.
+
+        Cannot be called while an event loop is running; await
+        ``agenerate_plan_many`` there instead.
+
+        Args:
+            pairs (List[Tuple[str, Dict[str, Any]]]): (schema_inference, metadata) for each dataset.
+            concurrency (int): Maximum number of requests in flight. Defaults to 32.
+            force_refresh (bool): Regenerate the plans even if cached responses exist.
+            max_tokens (int): Output token budget per plan. Defaults to 1024.
+
+        Returns:
+            List[Dict[str, Any]]: The generated plans, in the same order as ``pairs``.
+        """
+        _logger.info("Generating plans for %d datasets...", len(pairs))
+        return self.openai.chat_completion_many(
+            **self._many_kwargs(pairs, concurrency, force_refresh, max_tokens)
+        )
+
+    async def agenerate_plan_many(
+        self,
+        pairs: List[Tuple[str, Dict[str, Any]]],
+        concurrency: int = 32,
+        force_refresh: bool = False,
+        max_tokens: int = 1024,
+    ) -> List[Dict[str, Any]]:
+        """
+        Async version of ``generate_plan_many``, for use inside a running event loop.
+        """
+        _logger.info("Generating plans for %d datasets...", len(pairs))
+        return await self.openai.achat_completion_many(
+            **self._many_kwargs(pairs, concurrency, force_refresh, max_tokens)
+        )
+
+    def _many_kwargs(
+        self,
+        pairs: List[Tuple[str, Dict[str, Any]]],
+        concurrency: int,
+        force_refresh: bool,
+        max_tokens: int,
+    ) -> Dict[str, Any]:
+        """
+        Builds the ``chat_completion_many`` arguments for several datasets.
+        """
+        return dict(
+            prompts=[self._build_prompt(schema, metadata) for schema, metadata in pairs],
+            system_prompt=_PLANNER_SYSTEM_PROMPT,
+            max_tokens=max_tokens,
+            response_format="json_schema",
+            is_structured_output=True,
+            json_schema=self.response_format,
+            concurrency=concurrency,
+            force_refresh=force_refresh,
+        )
@@ -1,12 +1,16 @@
-import json
+import orjson
 from pprint import pprint
 
-from utils.data_reader import DataReader
-from utils.data_validation import DataValidation
-from utils.metadata_manager import MetadataManager
+from src.utils.data_reader import DataReader
+from src.utils.data_validation import DataValidation
+from src.utils.metadata_manager import MetadataManager
 from src.core.schema_inference import SchemaInference
 from src.core.planner import Planner
 from src.utils.dashboard import DashDashboard
+from src.utils.config import configure
+
+# Load environment variables and set up logging (library modules only create their loggers)
+configure()
 
 # Load the dataset
 data_reader = DataReader(data_path="data\\country_wise_latest.csv")
@@ -28,7 +32,7 @@ planner = Planner()
 execution_plan = planner.generate_plan(
     schema_inference=schema_data["choices"][0]["message"]["content"], metadata=metadata
 )
-plan = json.loads(execution_plan['choices'][0]['message']['content'])
+plan = orjson.loads(execution_plan['choices'][0]['message']['content'])
 print("*"* 150)
 pprint(plan)
 print("*"* 150)
@@ -0,0 +1,34 @@
+"""
+Process-wide configuration for applications built on these modules.
+"""
+
+# Importing necessary libraries and modules
+import logging
+from dotenv import load_dotenv
+
+from typing import Optional
+
+
+def configure(env_path: Optional[str] = None, level: int = logging.INFO) -> None:
+    """
+    Load environment variables and set up logging for the application.
+
+    Library modules only create their loggers and do not read ``.env`` files on
+    import, so the application entry point calls this once at startup. Logging
+    is left untouched if the root logger already has handlers, so calling it
+    again (or after the application configured logging itself) does not add
+    duplicate handlers. The line number is only included in the format at
+    DEBUG level.
+
+    Args:
+        env_path (Optional[str]): Path to the ``.env`` file. Defaults to None,
+            which searches for a ``.env`` file from the current directory upwards.
+        level (int): Logging level of the root logger. Defaults to logging.INFO.
+    """
+    load_dotenv(env_path, override=True)
+
+    if not logging.getLogger().handlers:
+        log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        if level <= logging.DEBUG:
+            log_format += " - line: %(lineno)d"
+        logging.basicConfig(level=level, format=log_format, datefmt="%Y-%m-%d %H:%M:%S")
@@ -2,9 +2,19 @@ import dash
 import dash_bootstrap_components as dbc
 from dash import dcc, html, Input, Output, State
 import plotly.express as px
+import plotly.io as pio
 import pandas as pd
+import numpy as np
+import threading
+from collections import OrderedDict
+
+# Serialize figures (including the NumPy arrays in their traces) with orjson
+pio.json.config.default_engine = "orjson"
 
 class DashDashboard:
+    # Number of filter selections whose rendered figures are kept
+    FIG_CACHE_SIZE = 128
+
     def __init__(self, execution_plan: dict, data: pd.DataFrame):
         """
         Initializes the Dash Dashboard class with improved UI and interactivity.
@@ -14,9 +24,78 @@ class DashDashboard:
         """
         self.execution_plan = execution_plan
         self.data = data
+        self._convert_to_categorical()
+        self._inv_index = {
+            f: self._build_inverted_index(f) for f in execution_plan.get("filters", [])
+        }
+        self._filter_options = {
+            f: self._build_filter_options(f) for f in execution_plan.get("filters", [])
+        }
+        self._fig_cache = OrderedDict()
+        self._fig_cache_lock = threading.Lock()
         self.app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
+        # Let browsers cache the static JS/CSS assets for a year
+        self.app.server.config["SEND_FILE_MAX_AGE_DEFAULT"] = 31536000
         self.create_layout()
     
+    def _convert_to_categorical(self, max_ratio: float = 0.5):
+        """
+        Converts low-cardinality string filter and x-axis columns to ``category`` dtype.
+
+        Filtering (``isin``), option building and chart grouping then work on integer
+        category codes instead of Python string objects. The caller's DataFrame is not
+        modified: converted columns are set on a shallow copy.
+
+        :param max_ratio: Convert a column only if unique values / rows is below this ratio
+        """
+        if self.data.empty:
+            return
+
+        columns = set(self.execution_plan.get("filters", []))
+        columns.update(chart.get("x_axis") for chart in self.execution_plan.get("charts", []))
+
+        to_convert = [
+            col for col in columns
+            if col in self.data.columns
+            and (pd.api.types.is_object_dtype(self.data[col]) or pd.api.types.is_string_dtype(self.data[col]))
+            and self.data[col].nunique() / len(self.data) < max_ratio
+        ]
+        if not to_convert:
+            return
+
+        self.data = self.data.copy(deep=False)
+        for col in to_convert:
+            self.data[col] = self.data[col].astype("category")
+
+    def _build_filter_options(self, column: str) -> list:
+        """
+        Builds the dropdown options for a filter column.
+
+        The options are the keys of the column's inverted index, so every selectable
+        value resolves to its rows whatever the column's dtype.
+
+        :param column: Name of the filter column
+        :return: List of {"label", "value"} option dicts
+        """
+        return [{"label": s, "value": s} for s in self._inv_index[column]]
+
+    def _build_inverted_index(self, column: str) -> dict:
+        """
+        Builds an inverted index mapping each value of a filter column to its row positions.
+
+        Keys are the string form of the values, matching the dropdown option values, so a
+        selection resolves to row positions without scanning the column.
+
+        :param column: Name of the filter column
+        :return: Dictionary of value -> NumPy array of row positions
+        """
+        index = {}
+        groups = self.data.groupby(column, observed=True, sort=False).indices
+        for value, rows in groups.items():
+            key = str(value)
+            index[key] = np.concatenate([index[key], rows]) if key in index else rows
+        return index
+
     def create_layout(self):
         """
         Creates an enhanced layout with a sidebar for filters, better responsiveness, and a reset button.
@@ -31,7 +110,7 @@ class DashDashboard:
                     html.Label(f"Filter by {f}"),
                     dcc.Dropdown(
                         id=f"filter-{f}",
-                        options=[{"label": str(val), "value": str(val)} for val in self.data[f].dropna().unique() if val is not None],
+                        options=self._filter_options[f],
                         multi=True
                     )
                 ]) for f in filters
@@ -51,64 +130,163 @@ class DashDashboard:
 
         self.setup_callbacks()
     
+    def _resolve_chart_spec(self, chart: dict):
+        """
+        Validates a chart definition against the data columns.
+
+        :param chart: Chart definition from the execution plan
+        :return: (type, x_axis, y_axis) tuple, or None if the chart cannot be drawn
+        """
+        x_axis = chart["x_axis"]
+        y_axis = chart.get("y_axis")  # Some charts (like Pie) don't need y_axis
+
+        # Validate column names
+        if x_axis not in self.data.columns:
+            print(f"Warning: Column '{x_axis}' not found in data.")
+            return None
+        if y_axis and y_axis not in self.data.columns:
+            print(f"Warning: Column '{y_axis}' not found in data. Selecting first numerical column.")
+            y_axis = next((col for col in self.data.select_dtypes(include=['number']).columns), None)
+            if not y_axis:
+                return None  # Skip chart if no numeric column is found
+        return (chart["type"], x_axis, y_axis)
+
+    def _build_figure(self, data: pd.DataFrame, spec: tuple):
+        """
+        Builds the Plotly figure for a resolved chart spec.
+
+        :param data: The (filtered) data to plot
+        :param spec: (type, x_axis, y_axis) tuple from ``_resolve_chart_spec``
+        :return: Plotly figure
+        """
+        chart_type, x_axis, y_axis = spec
+        if chart_type == "bar":
+            return px.bar(data, x=x_axis, y=y_axis, title=f"{x_axis} vs {y_axis}")
+        elif chart_type == "line":
+            return px.line(data, x=x_axis, y=y_axis, title=f"{x_axis} vs {y_axis}")
+        elif chart_type == "pie":
+            return px.pie(data, names=x_axis, values=y_axis, title=f"{x_axis} Distribution")
+        return px.scatter(data, x=x_axis, y=y_axis, title=f"{x_axis} vs {y_axis}")
+
+    def _get_figures(self, filter_values: tuple) -> list:
+        """
+        Returns the serialized figures for a filter selection, building them on a cache miss.
+
+        :param filter_values: Selected values of each filter (None when inactive)
+        :return: List of figure dicts, one per chart
+        """
+        # Reuse the figures of a previously seen filter selection
+        cache_key = tuple(tuple(sorted(v)) if v else None for v in filter_values)
+        with self._fig_cache_lock:
+            if cache_key in self._fig_cache:
+                self._fig_cache.move_to_end(cache_key)
+                return self._fig_cache[cache_key]
+
+        filtered_data = self._filter_data(filter_values)
+
+        # Build each distinct chart spec once; charts without a valid spec get an empty figure.
+        # The serialized form is stored so cache hits skip Plotly entirely.
+        fig_by_spec = {
+            spec: self._build_figure(filtered_data, spec).to_dict()
+            for spec in dict.fromkeys(self._chart_specs) if spec is not None
+        }
+        figures = [fig_by_spec.get(spec, {}) for spec in self._chart_specs]
+
+        with self._fig_cache_lock:
+            self._fig_cache[cache_key] = figures
+            if len(self._fig_cache) > self.FIG_CACHE_SIZE:
+                self._fig_cache.popitem(last=False)
+        return figures
+
+    def _filter_data(self, filter_values: tuple) -> pd.DataFrame:
+        """
+        Returns the rows matching a filter selection.
+
+        :param filter_values: Selected values of each filter (None when inactive)
+        :return: The matching rows, in their original order
+        """
+        # Resolve each active filter to row positions and intersect them
+        row_ids = None
+        for i, f in enumerate(self.execution_plan.get("filters", [])):
+            if filter_values[i]:
+                index = self._inv_index[f]
+                selected = [index[v] for v in filter_values[i] if v in index]
+                selected = np.concatenate(selected) if selected else np.empty(0, dtype=np.intp)
+                row_ids = selected if row_ids is None else np.intersect1d(row_ids, selected, assume_unique=True)
+
+        # Keep the original row order (line charts depend on it)
+        return self.data if row_ids is None else self.data.take(np.sort(row_ids))
+
     def setup_callbacks(self):
         """
         Defines Dash callbacks for dynamic filtering and reset functionality.
         """
         inputs = [Input(f"filter-{f}", "value") for f in self.execution_plan.get("filters", [])]
-        
+        # The columns never change, so validate the chart specs once up front
+        self._chart_specs = [self._resolve_chart_spec(chart) for chart in self.execution_plan.get("charts", [])]
+
         @self.app.callback(
             [Output(f"chart-{i}", "figure") for i in range(len(self.execution_plan.get("charts", [])))],
             inputs
         )
         def update_charts(*filter_values):
-            filtered_data = self.data.copy()
-
-            # Apply filters
-            for i, f in enumerate(self.execution_plan.get("filters", [])):
-                if filter_values[i]:
-                    filtered_data = filtered_data[filtered_data[f].isin(filter_values[i])]
-
-            figures = []
-            for chart in self.execution_plan["charts"]:
-                x_axis = chart["x_axis"]
-                y_axis = chart.get("y_axis")  # Some charts (like Pie) don't need y_axis
-                
-                # Validate column names
-                if x_axis not in filtered_data.columns:
-                    print(f"Warning: Column '{x_axis}' not found in data.")
+            figures = self._get_figures(filter_values)
+
+            # Initial render (page load): send the complete figures
+            if dash.ctx.triggered_id is None:
+                return figures
+
+            # Filtering only changes the traces; the layout (title, axes, template) is fixed per
+            # chart spec and already in the browser, so patch just the data
+            updates = []
+            for spec, fig in zip(self._chart_specs, figures):
+                if spec is None:
+                    updates.append(dash.no_update)
                     continue
-                if y_axis and y_axis not in filtered_data.columns:
-                    print(f"Warning: Column '{y_axis}' not found in data. Selecting first numerical column.")
-                    y_axis = next((col for col in filtered_data.select_dtypes(include=['number']).columns), None)
-                    if not y_axis:
-                        continue  # Skip chart if no numeric column is found
-                
-                # Generate charts dynamically
-                if chart["type"] == "bar":
-                    fig = px.bar(filtered_data, x=x_axis, y=y_axis, title=f"{x_axis} vs {y_axis}")
-                elif chart["type"] == "line":
-                    fig = px.line(filtered_data, x=x_axis, y=y_axis, title=f"{x_axis} vs {y_axis}")
-                elif chart["type"] == "pie":
-                    fig = px.pie(filtered_data, names=x_axis, values=y_axis, title=f"{x_axis} Distribution")
-                else:
-                    fig = px.scatter(filtered_data, x=x_axis, y=y_axis, title=f"{x_axis} vs {y_axis}")
-
-                figures.append(fig)
-
-            return figures
+                patch = dash.Patch()
+                patch["data"] = fig["data"]
+                updates.append(patch)
+            return updates
 
-        
-        @self.app.callback(
-            [Output(f"filter-{f}", "value") for f in self.execution_plan.get("filters", [])],
-            [Input("reset-btn", "n_clicks")],
-            prevent_initial_call=True
-        )
-        def reset_filters(n_clicks):
-            return [None] * len(self.execution_plan.get("filters", []))
+        # Resetting only clears the dropdowns, so do it in the browser without a server round-trip
+        filters = self.execution_plan.get("filters", [])
+        if filters:
+            self.app.clientside_callback(
+                f"function(n_clicks) {{ return Array({len(filters)}).fill(null); }}",
+                [Output(f"filter-{f}", "value") for f in filters],
+                [Input("reset-btn", "n_clicks")],
+                prevent_initial_call=True
+            )
     
-    def run(self):
+    @property
+    def server(self):
+        """
+        The underlying Flask app, for serving the dashboard with an external WSGI server
+        (e.g. ``gunicorn "module:dashboard.server" -k gthread --workers 4 --threads 8``).
+        """
+        return self.app.server
+
+    def run(self, host: str = "127.0.0.1", port: int = 8050, debug: bool = False, threads: int = 8):
         """
         Runs the improved Dash app.
+
+        With ``debug=True`` the Dash development server (hot reload, debugger) is used.
+        Otherwise the app is served by waitress, a multi-threaded production WSGI server,
+        so concurrent users do not block each other; if waitress is not installed, the
+        threaded Flask server is used instead.
+
+        :param host: Interface to bind to
+        :param port: Port to listen on
+        :param debug: Run the development server with debugging enabled
+        :param threads: Number of worker threads for waitress
         """
-        self.app.run_server(debug=True)
+        if debug:
+            self.app.run(host=host, port=port, debug=True)
+            return
+
+        try:
+            from waitress import serve
+        except ImportError:
+            self.app.run(host=host, port=port, debug=False)
+            return
+        serve(self.app.server, host=host, port=port, threads=threads)
@@ -2,29 +2,17 @@
 
 """
 
-# Adding directories to system path to allow importing custom modules
-import sys
-
-sys.path.append("./")
-sys.path.append("../")
-
 # Importing necessary libraries and modules
 import logging
+import functools
+import numpy as np
 import pandas as pd
-from dotenv import load_dotenv
+from pandas.util import hash_pandas_object
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 # Set up logging
 _logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s - line: %(lineno)d",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
-
-# Load Environment variables
-load_dotenv(override=True)
 
 class DataValidation:
     """
@@ -34,13 +22,29 @@ class DataValidation:
     data type consistency, and other potential issues in the dataset.
     """
     
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, subset: Optional[List[str]] = None):
         """
         Initializes the DataValidation class with a Pandas DataFrame.
 
+        Intermediate results shared between checks (missing value counts, the
+        numeric column block) are computed on first use and cached on the
+        instance, so running several checks scans the data only once for each.
+
         :param df: The Pandas DataFrame to be validated.
+        :param subset: Key columns identifying a row for the duplicate check. Defaults to all columns.
         """
         self.df = df
+        self.subset = subset
+
+    @functools.cached_property
+    def _missing_counts(self) -> pd.Series:
+        """Number of missing values per column."""
+        return self.df.isna().sum()
+
+    @functools.cached_property
+    def _numeric(self) -> pd.DataFrame:
+        """The numeric columns of the DataFrame."""
+        return self.df.select_dtypes(include=['number'])
 
     def check_missing_values(self) -> Dict[str, Any]:
         """
@@ -48,7 +52,7 @@ class DataValidation:
 
         :return: Dictionary containing missing value count and percentage per column.
         """
-        missing_counts = self.df.isnull().sum()
+        missing_counts = self._missing_counts
         total_rows = len(self.df)
         missing_percentage = (missing_counts / total_rows * 100).round(2)
         
@@ -60,13 +64,18 @@ class DataValidation:
         _logger.info("Missing values check completed.")
         return missing_summary
     
-    def check_duplicates(self) -> int:
+    def check_duplicates(self, subset: Optional[List[str]] = None) -> int:
         """
         Checks for duplicate rows in the DataFrame.
 
+        :param subset: Key columns identifying a row. Defaults to the instance's subset, or all columns.
         :return: The number of duplicate rows found.
         """
-        duplicate_count = self.df.duplicated().sum()
+        subset = subset or self.subset
+        df = self.df[subset] if subset else self.df
+        # Hash each row to a single uint64, then find duplicates in that one array
+        row_hashes = hash_pandas_object(df, index=False).to_numpy()
+        duplicate_count = pd.Series(row_hashes).duplicated(keep="first").sum()
         _logger.info("Duplicate rows check completed. Found %d duplicates.", duplicate_count)
         return int(duplicate_count)
     
@@ -86,21 +95,26 @@ class DataValidation:
 
         :return: Dictionary with column names as keys and number of outliers as values.
         """
-        outlier_summary = {}
-        
-        for col in self.df.select_dtypes(include=['number']):
-            Q1 = self.df[col].quantile(0.25)
-            Q3 = self.df[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            outlier_count = ((self.df[col] < lower_bound) | (self.df[col] > upper_bound)).sum()
-            
-            outlier_summary[col] = {
-                "lower_bound": lower_bound,
-                "upper_bound": upper_bound,
+        num = self._numeric
+
+        # Both quartiles of every column in one call, then one vectorized compare
+        # over the whole numeric block instead of two masks per column
+        Q1, Q3 = num.quantile([0.25, 0.75]).to_numpy(dtype="float64", na_value=np.nan)
+        IQR = Q3 - Q1
+        lower_bounds = Q1 - 1.5 * IQR
+        upper_bounds = Q3 + 1.5 * IQR
+        values = num.to_numpy(dtype="float64", na_value=np.nan)
+        outlier_counts = ((values < lower_bounds) | (values > upper_bounds)).sum(axis=0)
+
+        outlier_summary = {
+            col: {
+                "lower_bound": float(lower_bound),
+                "upper_bound": float(upper_bound),
                 "outlier_count": int(outlier_count)
             }
+            for col, lower_bound, upper_bound, outlier_count
+            in zip(num.columns, lower_bounds, upper_bounds, outlier_counts)
+        }
         
         _logger.info("Outlier detection completed.")
         return outlier_summary
@@ -116,14 +130,15 @@ class DataValidation:
         return unique_counts
     
     @classmethod
-    def generate_summary(cls, df: pd.DataFrame) -> Dict[str, Any]:
+    def generate_summary(cls, df: pd.DataFrame, subset: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Generates a summary report of data validation checks.
 
         :param df: The Pandas DataFrame to be validated.
+        :param subset: Key columns identifying a row for the duplicate check. Defaults to all columns.
         :return: A dictionary containing results of all validation checks.
         """
-        validator = cls(df)
+        validator = cls(df, subset=subset)
         summary = {
             "missing_values": validator.check_missing_values(),
             "duplicate_rows": validator.check_duplicates(),
@@ -2,30 +2,50 @@
 
 """
 
-# Adding directories to system path to allow importing custom modules
-import sys
-
-sys.path.append("./")
-sys.path.append("../")
-
 # Importing necessary libraries and modules
 import os
+import csv
 import logging
+from io import StringIO
 import pandas as pd
-from dotenv import load_dotenv
-from sqlalchemy import create_engine, text
-from sqlalchemy.exc import SQLAlchemyError
+import pyarrow as pa
 
 # Set up logging
 _logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s - line: %(lineno)d",
-    datefmt="%Y-%m-%d %H:%M:%S",
-)
 
-# Load Environment variables
-load_dotenv(override=True)
+
+def _copy_insert(table, conn, keys, data_iter) -> int:
+    """
+    ``DataFrame.to_sql`` insertion method that bulk-loads rows with PostgreSQL COPY.
+
+    Rows are streamed through ``COPY ... FROM STDIN`` instead of being sent as
+    INSERT statements, so the server parses them in a single pass.
+
+    Parameters:
+    table (pandas.io.sql.SQLTable): Target table
+    conn (sqlalchemy.engine.Connection): Connection to write through
+    keys (list): Column names
+    data_iter (Iterable): Rows to write
+
+    Returns:
+    int: Number of rows written
+    """
+    columns = ", ".join(f'"{k}"' for k in keys)
+    table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+
+    with conn.connection.cursor() as cur:
+        if hasattr(cur, "copy_expert"):
+            # psycopg2: serialize the rows to CSV and stream the buffer
+            buffer = StringIO()
+            csv.writer(buffer).writerows(data_iter)
+            buffer.seek(0)
+            cur.copy_expert(f"COPY {table_name} ({columns}) FROM STDIN WITH (FORMAT CSV)", buffer)
+        else:
+            # psycopg 3: let the driver encode each row
+            with cur.copy(f"COPY {table_name} ({columns}) FROM STDIN") as copy:
+                for row in data_iter:
+                    copy.write_row(row)
+        return cur.rowcount
 
 
 class DataManager:
@@ -64,6 +84,9 @@ class DataManager:
         """
         Connect to the database when entering the context manager.
         """
+        # Imported here so that importing this module does not pay for SQLAlchemy
+        from sqlalchemy import create_engine
+
         self.engine = create_engine(
             f"postgresql://{self.user}:{self.password}@{self.host}/{self.database}",
             isolation_level="AUTOCOMMIT",
@@ -80,19 +103,40 @@ class DataManager:
         if self.engine:
             self.engine.dispose()
 
-    def run_query(self, query: str, read_only: bool = False, params=None):
+    def run_query(
+        self,
+        query: str,
+        read_only: bool = False,
+        params=None,
+        as_arrow: bool = False,
+        batch_size: int = 10_000,
+    ):
         """
         Execute a SQL query and return results for SELECT statements.
 
+        With ``as_arrow=True`` the rows are streamed from a server-side cursor
+        ``batch_size`` rows at a time and converted column by column into a
+        ``pyarrow.Table``, so the full result is never held as Python tuples.
+
         Parameters:
         query (str): SQL query to execute
+        read_only (bool): Return the fetched rows instead of the affected row count
         params (dict, optional): Parameters for parameterized queries
+        as_arrow (bool): Stream the result into a pyarrow.Table (implies read_only)
+        batch_size (int): Rows fetched per round-trip when as_arrow is set
 
         Returns:
         list: Query results for SELECT queries
+        pa.Table: Query results when as_arrow is set
         int: Affected row count for other queries
         """
+        from sqlalchemy import text
+        from sqlalchemy.exc import SQLAlchemyError
+
         try:
+            if as_arrow:
+                return self._fetch_arrow(text(query), params or {}, batch_size)
+
             # Execute the query with the given parameters
             result = self.connection.execute(text(query), params or {})
 
@@ -106,12 +150,53 @@ class DataManager:
             print(f"Error executing query: {e}")
             raise
 
+    def _fetch_arrow(self, statement, params: dict, batch_size: int) -> pa.Table:
+        """
+        Stream a query result into a pyarrow.Table in batches.
+
+        Parameters:
+        statement (sqlalchemy.sql.elements.TextClause): Statement to execute
+        params (dict): Parameters for the statement
+        batch_size (int): Rows fetched per batch
+
+        Returns:
+        pa.Table: The query result
+        """
+        # yield_per needs a server-side (named) cursor, which psycopg2 only allows
+        # inside a transaction; the shared connection is in AUTOCOMMIT mode, so
+        # stream on a connection with the database's default isolation level
+        isolation_level = self.engine.dialect.default_isolation_level or "READ COMMITTED"
+        engine = self.engine.execution_options(isolation_level=isolation_level)
+        with engine.connect() as connection, connection.begin():
+            result = connection.execute(
+                statement, params, execution_options={"yield_per": batch_size}
+            )
+            with result:
+                columns = list(result.keys())
+                # Name the batch columns by position: a query can return duplicate
+                # column names (e.g. SELECT a.id, b.id), which schema promotion rejects
+                positions = [str(i) for i in range(len(columns))]
+                tables = [
+                    pa.Table.from_arrays(
+                        [pa.array(list(values)) for values in zip(*rows)], names=positions
+                    )
+                    for rows in result.partitions()
+                ]
+
+        if not tables:
+            return pa.Table.from_arrays([pa.array([], pa.null()) for _ in columns], names=columns)
+        # Batches whose column is entirely NULL are inferred as the null type
+        return pa.concat_tables(tables, promote_options="default").rename_columns(columns)
+
     def import_df(
         self, df: pd.DataFrame, table_name: str, if_exists: str = "fail", index=False
     ):
         """
         Import a pandas DataFrame into a PostgreSQL table.
 
+        With the psycopg2 or psycopg (3) driver the rows are bulk-loaded with
+        COPY; other drivers fall back to pandas' INSERT statements.
+
         Parameters:
         df (pd.DataFrame): DataFrame to import
         table_name (str): Target table name
@@ -121,10 +206,23 @@ class DataManager:
         Raises:
         SQLAlchemyError: If there is an error importing the DataFrame
         """
+        from sqlalchemy.exc import SQLAlchemyError
+
         try:
+            # Bulk-load with COPY when the driver supports it
+            method = (
+                _copy_insert
+                if self.engine.dialect.driver in ("psycopg2", "psycopg")
+                else None
+            )
+
             # Use the to_sql method to import the DataFrame
             df.to_sql(
-                name=table_name, con=self.connection, if_exists=if_exists, index=index
+                name=table_name,
+                con=self.connection,
+                if_exists=if_exists,
+                index=index,
+                method=method,
             )
         except SQLAlchemyError as e:
             # Print the error and raise an exception if the import fails
@@ -2,30 +2,237 @@
 
 """
 
-# Adding directories to system path to allow importing custom modules
-import sys
-
-sys.path.append("./")
-sys.path.append("../")
-
 # Importing necessary libraries and modules
+import io
+import copy
+import queue
+import atexit
+import threading
+import decimal
+import datetime
+import json
+import time
+import zlib
 import logging
+import functools
+import importlib.util
+import numpy as np
 import pandas as pd
-from dotenv import load_dotenv
-from pymongo import MongoClient, errors
 
-from typing import Dict, Any
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, TypedDict, Union
 
 # Set up logging
 _logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s - line: %(lineno)d",
-    datefmt="%Y-%m-%d %H:%M:%S",
+
+
+class ColumnMetadata(TypedDict):
+    """Schema of each entry in a metadata document's column list."""
+
+    column_name: str
+    data_type: str
+    sample_values: List[Any]
+
+
+# Fields of each entry in a metadata document's column list
+COLUMN_FIELDS = list(ColumnMetadata.__annotations__)
+
+# MongoClient options tuned for a few small metadata reads and writes:
+# - a small connection pool, kept warm with one idle connection
+# - wire compression (zstd/snappy when their packages are installed, else zlib),
+#   which shrinks the text-heavy metadata documents on the network; pymongo warns
+#   about compressors whose packages are missing, so only available ones are listed
+# - w=1: writes are acknowledged by the primary alone, saving a replication
+#   round-trip; a write can be lost if the primary fails before replicating it
+# - a short server selection timeout, so an unreachable server fails fast
+CLIENT_OPTS = dict(
+    maxPoolSize=10,
+    minPoolSize=1,
+    compressors=",".join(
+        name
+        for name, package in (("zstd", "zstandard"), ("snappy", "snappy"), ("zlib", "zlib"))
+        if importlib.util.find_spec(package) is not None
+    ),
+    w=1,
+    retryWrites=True,
+    serverSelectionTimeoutMS=5000,
 )
 
-# Load Environment variables
-load_dotenv(override=True)
+# Name of the compound index covering summary lookups
+SUMMARY_INDEX = "dashboard_name_1_summary_1"
+
+
+# Python types that BSON encodes as they are
+_BSON_TYPES = (type(None), bool, int, float, str, bytes, datetime.datetime)
+
+
+def _bson_value(value: Any) -> Any:
+    """
+    Converts one value to a type that BSON encodes natively.
+
+    Dates become midnight ``datetime``, ``Decimal`` becomes ``Decimal128``, NumPy
+    scalars become Python scalars, times and other values with ``isoformat()``
+    become ISO strings, and anything else becomes ``str(value)``.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        Any: The converted value.
+    """
+    if isinstance(value, _BSON_TYPES):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_bson_value(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _bson_value(v) for k, v in value.items()}
+    if isinstance(value, decimal.Decimal):
+        from bson.decimal128 import Decimal128
+
+        return Decimal128(value)
+    if isinstance(value, datetime.date):
+        return datetime.datetime.combine(value, datetime.time())
+    if isinstance(value, np.generic):
+        return _bson_value(value.item())
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def _to_bson_native(series: pd.Series) -> List[Any]:
+    """
+    Converts (non-null) sample values to Python types that BSON encodes natively.
+
+    Datetimes (NumPy or Arrow timestamps) are converted to ``datetime``, Arrow
+    dates (which BSON has no type for) to midnight ``datetime``, Arrow times to ISO
+    strings and timedeltas to strings; the values of other columns are converted
+    one by one with ``_bson_value``.
+
+    Args:
+        series: The sample values of one column.
+
+    Returns:
+        List[Any]: The converted values.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.ArrowDtype):
+        import pyarrow as pa
+
+        pa_type = dtype.pyarrow_dtype
+        if pa.types.is_date(pa_type):
+            dates = pa.array(series.array).to_pylist()
+            return [datetime.datetime.combine(d, datetime.time()) for d in dates]
+        if pa.types.is_timestamp(pa_type):
+            # datetime has microsecond precision; truncate nanoseconds instead of failing
+            values = pa.array(series.array).cast(pa.timestamp("us", pa_type.tz), safe=False)
+            return values.to_pylist()
+        if pa.types.is_time(pa_type):
+            values = pa.array(series.array).cast(pa.time64("us"), safe=False)
+            return [t.isoformat() for t in values.to_pylist()]
+
+    kind = dtype.kind
+    if kind == "M":
+        if getattr(dtype, "tz", None) is not None:
+            # BSON stores datetimes in UTC
+            series = series.dt.tz_convert("UTC").dt.tz_localize(None)
+        # tolist() of a microsecond datetime64 array yields datetime objects
+        return series.to_numpy(dtype="datetime64[us]").tolist()
+    if kind == "m":
+        return [str(v) for v in series]
+    return [_bson_value(v) for v in series.tolist()]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(mongo_uri: str):
+    """
+    Returns the shared MongoClient for a connection URI.
+
+    A MongoClient owns a connection pool and background monitoring threads, so
+    one client per URI is reused by every MetadataManager instead of opening a
+    new pool for each instance. The client is created with ``CLIENT_OPTS``,
+    which override the same options given in the URI.
+
+    Args:
+        mongo_uri: MongoDB connection URI.
+
+    Returns:
+        MongoClient: The MongoDB client.
+    """
+    # Imported here so that importing this module does not pay for pymongo
+    from pymongo import MongoClient
+
+    return MongoClient(mongo_uri, **CLIENT_OPTS)
+
+
+class _BackgroundWriter:
+    """
+    Writes queued metadata documents to MongoDB on a daemon thread.
+
+    Documents are collected into batches of up to ``batch_size`` or for at most
+    ``flush_interval`` seconds, then saved with one bulk write per collection.
+    Pending documents are flushed when the interpreter exits.
+    """
+
+    def __init__(self, batch_size: int = 100, flush_interval: float = 0.05, maxsize: int = 10_000) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue = queue.Queue(maxsize)
+        self._thread = threading.Thread(target=self._run, name="metadata-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.flush)
+
+    def put(self, collection, doc) -> None:
+        """Queues a document; blocks only while the queue is full."""
+        self._queue.put((collection, doc))
+
+    def flush(self) -> None:
+        """Waits until every queued document has been written."""
+        self._queue.join()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            except Exception:
+                _logger.exception("Background metadata write of %d documents failed.", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write(batch: list) -> None:
+        # Group by collection (the same namespace on two clients is two collections);
+        # a later save of the same dashboard supersedes an earlier one
+        grouped = {}
+        for collection, doc in batch:
+            key = (id(collection.database.client), collection.full_name)
+            _, docs = grouped.setdefault(key, (collection, {}))
+            docs[doc["dashboard_name"]] = doc
+        for collection, docs in grouped.values():
+            MetadataManager.save_many(collection, list(docs.values()))
+
+
+_writer = None
+_writer_lock = threading.Lock()
+
+
+def _get_writer() -> _BackgroundWriter:
+    """Returns the process-wide background writer, starting it on first use."""
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = _BackgroundWriter()
+        return _writer
 
 
 class MetadataManager:
@@ -41,6 +248,21 @@ class MetadataManager:
         collection (Collection): MongoDB collection instance.
     """
 
+    # (client, collection full name) pairs whose indexes have been created in this process
+    _indexed_collections = set()
+
+    # Encoded size (bytes) above which the column list is stored in GridFS instead of
+    # inline; keeps documents well below MongoDB's 16 MiB limit
+    GRIDFS_THRESHOLD = 8 << 20
+
+    # Seconds a retrieved metadata document is served from memory
+    CACHE_TTL = 10.0
+    # Maximum number of cached metadata documents; the least recently used is evicted
+    CACHE_SIZE = 1024
+    # (client, collection full name, dashboard name) -> [expiry time, metadata, columns frame]
+    _metadata_cache = OrderedDict()
+    _metadata_cache_lock = threading.Lock()
+
     def __init__(
         self,
         df: pd.DataFrame,
@@ -59,81 +281,429 @@ class MetadataManager:
         """
         self.df = df
         self.dashboard_name = dashboard_name  # Unique partition key
-        self.client = MongoClient(mongo_uri)
+        self.client = _get_client(mongo_uri)
         self.db = self.client[db_name]
         self.collection = self.db["metadata"]
+        self.metadata = None
+        self._raw = None  # BSON-encoded metadata, ready to insert
+        self._columns_blob = None  # Parquet-encoded column list, for GridFS
 
         # Ensure the dashboard_name is unique using an index
-        self.collection.create_index("dashboard_name", unique=True)
+        self.ensure_indexes(self.collection)
 
-    def generate_metadata(self, summary: Dict[str, Any]) -> Dict[str, Any]:
+    @classmethod
+    def ensure_indexes(cls, collection) -> None:
+        """
+        Creates the indexes of a metadata collection once per process.
+
+        Args:
+            collection (Collection): The MongoDB collection holding the metadata.
+        """
+        key = (collection.database.client, collection.full_name)
+        if key in cls._indexed_collections:
+            return
+        collection.create_index("dashboard_name", unique=True)
+        # Covers retrieve_metadata(summary_only=True): served from the index alone
+        collection.create_index([("dashboard_name", 1), ("summary", 1)], name=SUMMARY_INDEX)
+        cls._indexed_collections.add(key)
+
+    @classmethod
+    def save_many(cls, collection, docs: List[Dict[str, Any]]) -> int:
+        """
+        Saves the metadata of several dashboards in one bulk write.
+
+        Each document replaces the stored metadata of its dashboard, or is
+        inserted if the dashboard is new (upsert), so saving is idempotent and
+        usually takes one round-trip whether or not the dashboards already exist.
+        The write is unordered, so the server can apply the documents in parallel
+        and a failing document does not stop the remaining ones.
+
+        A stored document whose column list is kept in GridFS is not matched by
+        the bulk write; its upsert then fails on the unique index and it is
+        replaced on its own, returning the old GridFS id so the column list can
+        be deleted. The same retry handles two concurrent upserts of a new
+        dashboard. Only these cases take an extra round-trip per document.
+
+        Args:
+            collection (Collection): The MongoDB collection holding the metadata.
+            docs (List[Dict[str, Any]]): Metadata documents to save.
+
+        Returns:
+            int: Number of documents inserted or replaced.
+        """
+        from pymongo import ReplaceOne, errors
+
+        if not docs:
+            return 0
+
+        cls.ensure_indexes(collection)
+        for doc in docs:
+            cls._invalidate(collection, doc["dashboard_name"])
+
+        requests = [
+            ReplaceOne(
+                {"dashboard_name": doc["dashboard_name"], "columns_blob_id": {"$exists": False}},
+                doc,
+                upsert=True,
+            )
+            for doc in docs
+        ]
+        conflicts = []
+        try:
+            try:
+                result = collection.bulk_write(
+                    requests, ordered=False, bypass_document_validation=True
+                )
+                saved = result.upserted_count + result.matched_count
+            except errors.BulkWriteError as e:
+                saved = e.details.get("nUpserted", 0) + e.details.get("nMatched", 0)
+                for error in e.details.get("writeErrors", []):
+                    if error.get("code") != 11000:
+                        raise
+                    conflicts.append(docs[error["index"]])
+
+            orphaned = []
+            for doc in conflicts:
+                previous = collection.find_one_and_replace(
+                    {"dashboard_name": doc["dashboard_name"]},
+                    doc,
+                    projection={"_id": 0, "columns_blob_id": 1},
+                    upsert=True,
+                    bypass_document_validation=True,
+                )
+                saved += 1
+                blob_id = (previous or {}).get("columns_blob_id")
+                if blob_id is not None and blob_id != doc.get("columns_blob_id"):
+                    orphaned.append(blob_id)
+        finally:
+            # A retrieval during the write may have cached the replaced document again
+            for doc in docs:
+                cls._invalidate(collection, doc["dashboard_name"])
+
+        # Delete the column lists no longer referenced by the saved documents
+        if orphaned:
+            import gridfs
+
+            fs = gridfs.GridFS(collection.database)
+            for blob_id in orphaned:
+                fs.delete(blob_id)
+
+        _logger.info("Metadata saved for %d of %d dashboards.", saved, len(docs))
+        return saved
+
+    def generate_metadata(self, summary: Dict[str, Any], compress: bool = False) -> Dict[str, Any]:
         """
         Generates metadata for the dataset.
+
+        With ``compress=True`` the column list is stored as zlib-compressed JSON
+        under ``columns_zlib`` instead of ``columns``, which shrinks the documents
+        of wide datasets; ``retrieve_metadata`` decompresses it transparently.
+        Sample values that are not JSON types (e.g. timestamps) are stored as strings.
+
+        If the encoded document would exceed ``GRIDFS_THRESHOLD`` bytes, the column
+        list is instead written to GridFS as a zstd-compressed Parquet file when the
+        metadata is saved, and the document only keeps a pointer to it.
         
         Args:
             summary (Dict): Data validation summary containing missing values and duplicates.
+            compress (bool): Store the column list compressed. Defaults to False.
 
         Returns: 
             (Dict[str, Any]) - A dictionary containing metadata.
         """
         _logger.info("Generating metadata for dashboard: %s", self.dashboard_name)
 
-        metadata_list = []
-        for col in self.df.columns:
-            sample_values = self.df[col].dropna().sample(5).tolist()
+        # Sample the rows once for all columns instead of shuffling each column
+        n = len(self.df)
+        k = min(5, n)
+        sample_df = self.df.sample(k, random_state=0) if n else self.df
+        rng = np.random.default_rng(0)
+
+        metadata_list: List[ColumnMetadata] = []
+        for (col, series), (_, sampled) in zip(self.df.items(), sample_df.items()):
+            sampled = sampled.dropna()
+            if len(sampled) < k:
+                # Sparse column: pick the samples among its non-null positions instead
+                valid = np.flatnonzero(series.notna().to_numpy())
+                pick = rng.choice(valid, size=min(k, valid.size), replace=False)
+                sampled = series.iloc[pick]
             metadata_list.append(
-                {
-                    "column_name": col,
-                    "data_type": str(self.df[col].dtype),
-                    "sample_values": sample_values,
-                }
+                ColumnMetadata(
+                    column_name=col,
+                    data_type=series.dtype.name,
+                    sample_values=_to_bson_native(sampled),
+                )
             )
 
         self.metadata = {
             "dashboard_name": self.dashboard_name,
+            # Column name -> data type, small enough to be indexed (see SUMMARY_INDEX)
+            "summary": {str(col["column_name"]): col["data_type"] for col in metadata_list},
             "columns": metadata_list,
             "data_summary": summary
         }
+
+        document = self.metadata
+        if compress:
+            from bson import Binary
+
+            document = dict(self.metadata)
+            document["columns_zlib"] = Binary(
+                zlib.compress(json.dumps(document.pop("columns"), default=str).encode("utf-8"))
+            )
+
+        # Encode the document once, so saving it skips PyMongo's per-field encoder
+        from bson import encode
+        from bson.raw_bson import RawBSONDocument
+
+        encoded = encode(document)
+        if len(encoded) > self.GRIDFS_THRESHOLD:
+            self._raw, self._columns_blob = None, self._encode_columns(metadata_list)
+        else:
+            self._raw, self._columns_blob = RawBSONDocument(encoded), None
         _logger.info("Metadata generated.")
         return self.metadata
 
-    def save_metadata(self) -> None:
+    def save_metadata(self, background: bool = False) -> None:
         """
-        Saves the metadata to MongoDB.
+        Saves the metadata to MongoDB, replacing any metadata stored for the dashboard.
+
+        Args:
+            background (bool): Queue the document and return immediately; a background
+                thread writes queued documents in batches. Call ``MetadataManager.flush()``
+                to wait for them (pending writes are also flushed at exit). Metadata
+                offloaded to GridFS is always saved synchronously. Defaults to False.
         """
         if not self.metadata:
             _logger.warning("No metadata to save.")
             return
 
-        try:
-            self.collection.insert_one(self.metadata)
-            _logger.info("Metadata saved for dashboard: %s", self.dashboard_name)
-        except errors.DuplicateKeyError:
-            _logger.warning(
-                "A dashboard with the name '%s' already exists. Use a different name.",
-                self.dashboard_name,
+        if self._columns_blob is None:
+            doc = self._raw or self.metadata
+            if background:
+                # Do not serve a cached copy of the replaced document in the meantime
+                self.invalidate(self.dashboard_name)
+                _get_writer().put(self.collection, doc)
+            else:
+                self.save_many(self.collection, [doc])
+            return
+
+        # Store the column list in GridFS and the document with a pointer to it
+        import gridfs
+
+        # save_many deletes the column list of the replaced document
+        blob_id = gridfs.GridFS(self.db).put(
+            self._columns_blob, filename=f"{self.dashboard_name}.parquet"
+        )
+        self.save_many(self.collection, [{
+            "dashboard_name": self.dashboard_name,
+            "columns_blob_id": blob_id,
+            "summary": self.metadata["summary"],
+            "column_count": len(self.metadata["columns"]),
+            "data_summary": self.metadata["data_summary"],
+        }])
+
+    @staticmethod
+    def _encode_columns(columns: List[ColumnMetadata]) -> bytes:
+        """
+        Encodes a column list as a zstd-compressed Parquet file.
+
+        Sample values differ in type between columns, so they are stored as JSON strings.
+
+        Args:
+            columns (List[ColumnMetadata]): The column list.
+
+        Returns:
+            bytes: The Parquet file.
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.Table.from_pylist([
+            {**col, "sample_values": json.dumps(col["sample_values"], default=str)}
+            for col in columns
+        ])
+        buffer = io.BytesIO()
+        pq.write_table(table, buffer, compression="zstd")
+        return buffer.getvalue()
+
+    def _load_columns(self, blob_id) -> List[ColumnMetadata]:
+        """
+        Reads a column list stored in GridFS by ``save_metadata``.
+
+        Args:
+            blob_id (ObjectId): GridFS id of the Parquet file.
+
+        Returns:
+            List[ColumnMetadata]: The column list.
+        """
+        import gridfs
+        import pyarrow.parquet as pq
+
+        data = gridfs.GridFS(self.db).get(blob_id).read()
+        columns = pq.read_table(io.BytesIO(data)).to_pylist()
+        for col in columns:
+            col["sample_values"] = json.loads(col["sample_values"])
+        return columns
+
+    @staticmethod
+    def flush() -> None:
+        """
+        Waits until all metadata queued by ``save_metadata(background=True)`` is written.
+        """
+        if _writer is not None:
+            _writer.flush()
+
+    @classmethod
+    def _cache_get(cls, key: tuple) -> Optional[list]:
+        """Returns the unexpired cache entry for a key, or None."""
+        with cls._metadata_cache_lock:
+            entry = cls._metadata_cache.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del cls._metadata_cache[key]
+                return None
+            cls._metadata_cache.move_to_end(key)
+            return entry
+
+    @classmethod
+    def _cache_put(cls, key: tuple, entry: list) -> None:
+        """Caches an entry, evicting the least recently used ones beyond ``CACHE_SIZE``."""
+        with cls._metadata_cache_lock:
+            cls._metadata_cache[key] = entry
+            cls._metadata_cache.move_to_end(key)
+            while len(cls._metadata_cache) > cls.CACHE_SIZE:
+                cls._metadata_cache.popitem(last=False)
+
+    @classmethod
+    def _invalidate(cls, collection, dashboard_name: str) -> None:
+        with cls._metadata_cache_lock:
+            cls._metadata_cache.pop(
+                (collection.database.client, collection.full_name, dashboard_name), None
             )
 
-    def retrieve_metadata(self, dashboard_name: str) -> Dict[str, Any]:
+    def invalidate(self, dashboard_name: str) -> None:
+        """
+        Drops the cached metadata of a dashboard, so the next retrieval reads MongoDB.
+
+        Args:
+            dashboard_name (str): Unique name of the dashboard.
+        """
+        self._invalidate(self.collection, dashboard_name)
+
+    def retrieve_metadata(
+        self,
+        dashboard_name: str,
+        as_frame: bool = False,
+        limit: Optional[int] = None,
+        summary_only: bool = False,
+    ) -> Optional[Union[Dict[str, Any], pd.DataFrame]]:
         """
         Retrieves metadata from MongoDB for a given dashboard.
 
+        Found documents are cached in memory for ``CACHE_TTL`` seconds (at most
+        ``CACHE_SIZE`` of them), so repeated loads of the same dashboard do not
+        query MongoDB each time.
+        Saving metadata through this class invalidates the cached entry.
+
         Args:
             dashboard_name (str): Unique name of the dashboard.
+            as_frame (bool): Return the column metadata as a DataFrame with one row
+                per column (column_name, data_type, sample_values). The frame is
+                built once per cached document; each call gets its own copy.
+                Defaults to False.
+            limit (Optional[int]): Return only the first ``limit`` columns. The slice
+                is taken by MongoDB, so the omitted columns are never sent or
+                decoded. Defaults to None (all columns).
+            summary_only (bool): Return only ``{"summary": {column: data type}}``.
+                The lookup is answered from a covering index, without reading
+                the metadata document. Defaults to False.
 
         Returns:
-            Dict[str, Any]: A dictionary containing metadata if found, or None.
+            Optional[Union[Dict[str, Any], pd.DataFrame]]: A dictionary containing
+                metadata (or its column DataFrame) if found, or None.
 
         Raises:
             None
         """
-        result = self.collection.find_one(
-            {"dashboard_name": dashboard_name}, {"_id": 0, "columns": 1}
-        )
+        if summary_only:
+            result = self.collection.find_one(
+                {"dashboard_name": dashboard_name},
+                {"_id": 0, "summary": 1},
+                hint=SUMMARY_INDEX,
+            )
+            if not result or "summary" not in result:
+                _logger.warning("No metadata summary found for dashboard: %s", dashboard_name)
+                return None
+            return result
+
+        key = (self.client, self.collection.full_name, dashboard_name)
+        cached = self._cache_get(key)
+        if cached:
+            _logger.info("Metadata retrieved from cache for dashboard: %s", dashboard_name)
+            if as_frame:
+                frame = self._columns_frame(cached)
+                return frame if limit is None else frame.head(limit)
+            return copy.deepcopy({"columns": cached[1]["columns"][:limit]})
+
+        if limit is None:
+            result = self.collection.find_one(
+                {"dashboard_name": dashboard_name},
+                {"_id": 0, "columns": 1, "columns_zlib": 1, "columns_blob_id": 1},
+            )
+        else:
+            # Let MongoDB slice the column list; a compressed list is sliced after decompressing
+            result = next(
+                self.collection.aggregate([
+                    {"$match": {"dashboard_name": dashboard_name}},
+                    {"$limit": 1},
+                    {"$project": {
+                        "_id": 0,
+                        "columns": {"$slice": ["$columns", limit]},
+                        "columns_zlib": 1,
+                        "columns_blob_id": 1,
+                    }},
+                ]),
+                None,
+            )
 
         if not result:
             _logger.warning("No metadata found for dashboard: %s", dashboard_name)
             return None
 
+        # Decompress a column list stored with generate_metadata(compress=True)
+        if "columns_zlib" in result:
+            result["columns"] = json.loads(zlib.decompress(result.pop("columns_zlib")))[:limit]
+        # Load a column list offloaded to GridFS
+        elif "columns_blob_id" in result:
+            result["columns"] = self._load_columns(result.pop("columns_blob_id"))[:limit]
+
+        # A partial document is not cached
+        if limit is not None:
+            _logger.info("Metadata retrieved for dashboard: %s", dashboard_name)
+            return pd.DataFrame.from_records(result["columns"], columns=COLUMN_FIELDS) if as_frame else result
+
+        # Callers get a copy, so they cannot modify the cached document
+        entry = [time.monotonic() + self.CACHE_TTL, result, None]
+        self._cache_put(key, entry)
         _logger.info("Metadata retrieved for dashboard: %s", dashboard_name)
-        return result
+        return self._columns_frame(entry) if as_frame else copy.deepcopy(result)
+
+    @staticmethod
+    def _columns_frame(entry: list) -> pd.DataFrame:
+        """
+        Returns the column metadata of a cache entry as a DataFrame, building it on first use.
+
+        Args:
+            entry (list): Cache entry of [expiry time, metadata, columns frame].
+
+        Returns:
+            pd.DataFrame: One row per column; a copy of the cached frame.
+        """
+        if entry[2] is None:
+            entry[2] = pd.DataFrame.from_records(entry[1]["columns"], columns=COLUMN_FIELDS)
+        frame = entry[2].copy(deep=False)
+        # The sample value lists are shared with the cached document
+        frame["sample_values"] = [list(values) for values in frame["sample_values"]]
+        return frame
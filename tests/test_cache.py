@@ -0,0 +1,24 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from src.core.cache import ResponseCache
+
+
+def test_cache_dir_created_on_first_write(tmp_path):
+    cache_dir = tmp_path / "llm"
+    cache = ResponseCache(str(cache_dir))
+
+    assert not cache_dir.exists()
+    assert cache.get("key") is None
+
+    cache.set("key", {"a": 1})
+    assert cache.get("key") == {"a": 1}
+
+
+def test_concurrent_writes_of_one_key(tmp_path):
+    cache = ResponseCache(str(tmp_path))
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda i: cache.set("key", {"i": i}), range(64)))
+
+    assert cache.get("key")["i"] in range(64)
+    assert [p.name for p in tmp_path.iterdir()] == ["key.json"]
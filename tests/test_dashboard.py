@@ -0,0 +1,32 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("dash")
+pytest.importorskip("dash_bootstrap_components")
+pytest.importorskip("plotly")
+
+from src.utils.dashboard import DashDashboard
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pd.to_datetime(["2024-01-01", "2024-01-02", "2024-01-01", "2024-01-03"]),
+        pd.Categorical(["a", "b", "a", "c"]),
+        [1.5, 2.5, 1.5, 3.5],
+        [1, 2, 1, 3],
+    ],
+    ids=["datetime", "categorical", "float", "int"],
+)
+def test_filter_option_selects_its_rows(values):
+    data = pd.DataFrame({"f": values, "y": range(4)})
+    dashboard = DashDashboard({"filters": ["f"], "charts": []}, data)
+
+    options = dashboard._filter_options["f"]
+
+    assert len(options) == 3
+    for option in options:
+        filtered = dashboard._filter_data(([option["value"]],))
+        expected = [i for i, value in enumerate(data["f"]) if str(value) == option["value"]]
+        assert not filtered.empty
+        assert filtered["y"].tolist() == expected
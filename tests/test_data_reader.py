@@ -0,0 +1,31 @@
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+
+from src.utils.data_reader import DataReader
+
+MTCARS = "data/mtcars.parquet"
+
+
+@pytest.mark.parametrize("engine", ["auto", "pyarrow"])
+def test_load_parquet(engine):
+    df = DataReader(data_path=MTCARS, engine=engine).load_data()
+
+    assert len(df) > 0
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+
+@pytest.mark.parametrize("engine", ["auto", "pyarrow"])
+def test_load_parquet_numpy_dtypes(engine):
+    df = DataReader(data_path=MTCARS, engine=engine, dtype_backend=None).load_data()
+
+    assert not any(isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+
+def test_load_parquet_polars():
+    pytest.importorskip("polars")
+
+    df = DataReader(data_path=MTCARS, engine="polars", n_rows=3).load_data()
+
+    assert len(df) == 3
@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("pandas")
+pa = pytest.importorskip("pyarrow")
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from src.utils.database import DataManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    # Mirror __enter__, which connects in AUTOCOMMIT mode
+    manager = DataManager()
+    manager.engine = sqlalchemy.create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}", isolation_level="AUTOCOMMIT"
+    )
+    manager.connection = manager.engine.connect()
+    yield manager
+    manager.__exit__(None, None, None)
+
+
+def test_run_query_as_arrow(manager):
+    manager.run_query("CREATE TABLE t (id INTEGER, name TEXT)")
+    manager.run_query("INSERT INTO t VALUES (1, 'a'), (2, NULL), (3, 'c')")
+
+    table = manager.run_query("SELECT * FROM t ORDER BY id", as_arrow=True, batch_size=2)
+
+    assert isinstance(table, pa.Table)
+    assert table.to_pydict() == {"id": [1, 2, 3], "name": ["a", None, "c"]}
+
+
+def test_run_query_as_arrow_empty(manager):
+    manager.run_query("CREATE TABLE t (id INTEGER)")
+
+    table = manager.run_query("SELECT * FROM t", as_arrow=True)
+
+    assert table.num_rows == 0
+    assert table.column_names == ["id"]
+
+
+def test_run_query_as_arrow_duplicate_columns(manager):
+    manager.run_query("CREATE TABLE a (id INTEGER)")
+    manager.run_query("CREATE TABLE b (id INTEGER)")
+    manager.run_query("INSERT INTO a VALUES (1)")
+    manager.run_query("INSERT INTO b VALUES (2)")
+
+    table = manager.run_query("SELECT a.id, b.id FROM a, b", as_arrow=True)
+
+    assert table.column_names == ["id", "id"]
+    assert [column.to_pylist() for column in table.columns] == [[1], [2]]
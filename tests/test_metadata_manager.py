@@ -0,0 +1,111 @@
+import datetime
+import decimal
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("pyarrow")
+bson = pytest.importorskip("bson")
+
+from src.utils.data_reader import DataReader
+from src.utils.metadata_manager import MetadataManager, _to_bson_native
+
+
+def _manager(df, dashboard_name="test"):
+    # Skip __init__, which connects to MongoDB
+    manager = MetadataManager.__new__(MetadataManager)
+    manager.df = df
+    manager.dashboard_name = dashboard_name
+    return manager
+
+
+def test_generate_metadata_csv_date_column(tmp_path):
+    path = tmp_path / "dates.csv"
+    path.write_text("day,value\n2024-01-02,1\n2024-03-04,2\n")
+    df = DataReader(data_path=str(path)).load_data()
+
+    metadata = _manager(df).generate_metadata(summary={})
+
+    samples = metadata["columns"][0]["sample_values"]
+    assert sorted(samples) == [datetime.datetime(2024, 1, 2), datetime.datetime(2024, 3, 4)]
+    bson.encode(metadata)
+
+
+def test_generate_metadata_csv_time_column(tmp_path):
+    path = tmp_path / "times.csv"
+    path.write_text("t,v\n12:30:00,1\n08:15:30,2\n")
+    df = DataReader(data_path=str(path)).load_data()
+
+    metadata = _manager(df).generate_metadata(summary={})
+
+    assert sorted(metadata["columns"][0]["sample_values"]) == ["08:15:30", "12:30:00"]
+    bson.encode(metadata)
+
+
+def test_to_bson_native_object_values():
+    values = pd.Series(
+        [datetime.date(2024, 1, 2), datetime.time(1, 2), decimal.Decimal("1.5"), {1, 2}],
+        dtype=object,
+    )
+
+    converted = _to_bson_native(values)
+
+    assert converted[:2] == [datetime.datetime(2024, 1, 2), "01:02:00"]
+    assert converted[2] == bson.decimal128.Decimal128("1.5")
+    assert isinstance(converted[3], str)
+    bson.encode({"values": converted})
+
+
+def test_to_bson_native_timestamps():
+    arrow = pd.Series(pd.to_datetime(["2024-01-02 03:04:05"])).astype("timestamp[ns][pyarrow]")
+    numpy = pd.Series(pd.to_datetime(["2024-01-02 03:04:05"]))
+
+    expected = [datetime.datetime(2024, 1, 2, 3, 4, 5)]
+    assert _to_bson_native(arrow) == expected
+    assert _to_bson_native(numpy) == expected
+    assert all(type(v) is datetime.datetime for v in _to_bson_native(numpy))
+
+
+def test_background_writer_groups_by_client(monkeypatch):
+    from types import SimpleNamespace
+
+    from src.utils.metadata_manager import _BackgroundWriter
+
+    def collection(client):
+        database = SimpleNamespace(client=client)
+        return SimpleNamespace(database=database, full_name="DashboardMetadata.metadata")
+
+    saved = []
+    monkeypatch.setattr(
+        MetadataManager, "save_many", classmethod(lambda cls, c, docs: saved.append((c, docs)))
+    )
+    a, b = collection(object()), collection(object())
+
+    _BackgroundWriter._write([(a, {"dashboard_name": "x"}), (b, {"dashboard_name": "y"})])
+
+    assert saved == [(a, [{"dashboard_name": "x"}]), (b, [{"dashboard_name": "y"}])]
+
+
+def test_metadata_cache_is_bounded(monkeypatch):
+    from collections import OrderedDict
+
+    monkeypatch.setattr(MetadataManager, "_metadata_cache", OrderedDict())
+    monkeypatch.setattr(MetadataManager, "CACHE_SIZE", 2)
+    for name in ["a", "b", "c"]:
+        MetadataManager._cache_put(name, [float("inf"), {}, None])
+
+    assert list(MetadataManager._metadata_cache) == ["b", "c"]
+    assert MetadataManager._cache_get("a") is None
+
+    MetadataManager._cache_put("d", [0.0, {}, None])
+    assert MetadataManager._cache_get("d") is None
+    assert "d" not in MetadataManager._metadata_cache
+
+
+def test_columns_frame_copies_sample_values():
+    entry = [float("inf"), {"columns": [{"column_name": "x", "data_type": "int64", "sample_values": [1, 2]}]}, None]
+
+    MetadataManager._columns_frame(entry)["sample_values"][0].append(3)
+
+    assert entry[1]["columns"][0]["sample_values"] == [1, 2]
+    assert MetadataManager._columns_frame(entry)["sample_values"][0] == [1, 2]
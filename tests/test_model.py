@@ -0,0 +1,16 @@
+import pytest
+
+pytest.importorskip("openai")
+
+from src.core.model import OpenAIChatHandler
+
+
+def test_rejected_request_leaves_history_unchanged():
+    handler = OpenAIChatHandler(openai_key="test", cache_dir=None)
+
+    with pytest.raises(ValueError):
+        handler.chat_completion("hello", system_prompt="system", is_structured_output=True)
+    with pytest.raises(ValueError):
+        handler.chat_completion("hello", response_format="json_object")
+
+    assert handler.conversation_history == []